@@ -4,6 +4,7 @@ import hashlib
 import mimetypes
 from typing import Any, TypeVar
 from urllib.parse import urlparse
+import orjson
 from pydantic import BaseModel
 from langchain_core.messages import AIMessage, HumanMessage
 from langgraph.types import Command
@@ -12,7 +13,9 @@ from src.core.workflow.state import State
 from src.infrastructure.llm.llm import ainvoke_with_retry, is_rate_limited_error
 
 T = TypeVar("T", bound=BaseModel)
+_JSON_DECODER = json.JSONDecoder()
 ARTIFACT_STEP_ID_PATTERN = re.compile(r"step_(\d+)_")
+ERROR_TEXT_PATTERN = re.compile(r"error|failed|失敗|エラー", re.IGNORECASE)
 RESEARCH_INPUT_KEYWORDS = (
     "research",
     "調査",
@@ -39,18 +42,41 @@ def _normalize_worker_capability(value: str | None) -> str:
     return "worker"
 
 def _update_artifact(state: State, key: str, value: Any) -> dict[str, Any]:
-    """Helper to update artifacts dictionary."""
-    artifacts = state.get("artifacts", {})
-    if artifacts is None:
-        artifacts = {}
-    artifacts[key] = value
-    return artifacts
+    """Helper to build an artifacts update.
+
+    Returns only the changed entry; the `merge_artifacts` reducer folds it into
+    the existing artifacts, so neither the full dict nor the input state is touched.
+    """
+    del state
+    return {key: value}
+
+def dumps_json(value: Any, *, indent: bool = False) -> str:
+    """Serialize value to JSON text (compact, or 2-space indented), keeping non-ASCII characters as-is."""
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(value, option=option).decode("utf-8")
+
+def looks_like_error_text(text: str | None) -> bool:
+    """Return True when text mentions an error or failure keyword."""
+    if not isinstance(text, str):
+        return False
+    return ERROR_TEXT_PATTERN.search(text) is not None
 
 def extract_first_json(text: str) -> str | None:
     """Extract first JSON object from text."""
     match = re.search(r"\{.*\}", text, re.DOTALL)
     return match.group(0) if match else None
 
+def decode_first_json_object(text: str) -> Any | None:
+    """Decode the first JSON object in text, ignoring anything after it."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        value, _ = _JSON_DECODER.raw_decode(text, start)
+    except ValueError:
+        return None
+    return value
+
 def split_content_parts(content: Any) -> tuple[str, str]:
     """Split content into (thinking_text, normal_text)."""
     thinking_parts: list[str] = []
@@ -666,7 +692,7 @@ def build_worker_error_payload(
         "failed_checks": failed_checks or ["worker_execution"],
         "notes": notes or error_text,
     }
-    return json.dumps(payload, ensure_ascii=False)
+    return dumps_json(payload)
 
 async def run_structured_output(
     llm,
@@ -742,7 +768,7 @@ def create_worker_response(
     response_format = settings.RESPONSE_FORMAT or "Role: {role}\nContent: {content}"
     response_content = response_format.format(
         role=worker_capability,
-        content=json.dumps(compact_payload, ensure_ascii=False),
+        content=dumps_json(compact_payload),
     )
 
     main_message = AIMessage(
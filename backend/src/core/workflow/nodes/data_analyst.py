@@ -20,6 +20,7 @@ from src.domain.designer.pptx_parser import extract_pptx_context
 from src.infrastructure.storage.gcs import download_blob_as_bytes, upload_to_gcs
 from .common import (
     create_worker_response,
+    looks_like_error_text,
     resolve_asset_bindings_for_step,
     resolve_step_dependency_context,
     resolve_selected_assets_for_step,
@@ -60,6 +61,7 @@ PACKAGE_MODE_KEYWORDS = (
 TEMPLATE_MASTER_KEYWORDS = ("マスター", "master", "テンプレート", "template", "layout")
 TEMPLATE_SLIDE_KEYWORDS = ("スライド", "content", "本文")
 DATA_ANALYST_STREAM_CHUNK_CHARS = 1200
+DATA_ANALYST_DOWNLOAD_CONCURRENCY = 5
 
 
 def _resolve_data_analyst_mode(step: dict) -> str:
@@ -158,13 +160,6 @@ def _normalize_failed_checks(checks: object) -> list[str]:
     return normalized
 
 
-def _looks_like_error_text(text: str | None) -> bool:
-    if not isinstance(text, str):
-        return False
-    lowered = text.lower()
-    return "error" in lowered or "失敗" in text or "エラー" in text or "failed" in lowered
-
-
 def _normalize_text(value: Any) -> str:
     if not isinstance(value, str):
         return ""
@@ -914,20 +909,31 @@ async def _download_input_files(
     inputs_dir = os.path.join(workspace_dir, "inputs")
     os.makedirs(inputs_dir, exist_ok=True)
 
-    url_to_local: dict[str, str] = {}
-    manifest: list[dict[str, str]] = []
+    semaphore = asyncio.Semaphore(DATA_ANALYST_DOWNLOAD_CONCURRENCY)
 
-    for index, source_url in enumerate(urls, start=1):
-        payload = await asyncio.to_thread(download_blob_as_bytes, source_url)
+    async def _fetch(index: int, source_url: str) -> str | None:
+        async with semaphore:
+            payload = await asyncio.to_thread(download_blob_as_bytes, source_url)
         if payload is None:
             logger.warning("Data Analyst failed to fetch input file: %s", source_url)
-            continue
+            return None
 
         filename = _safe_filename_from_url(source_url, index)
         local_path = os.path.join(inputs_dir, filename)
         with open(local_path, "wb") as fp:
             fp.write(payload)
+        return local_path
+
+    # Each download is written as soon as it lands; results stay in input order.
+    local_paths = await asyncio.gather(
+        *(_fetch(index, source_url) for index, source_url in enumerate(urls, start=1))
+    )
 
+    url_to_local: dict[str, str] = {}
+    manifest: list[dict[str, str]] = []
+    for source_url, local_path in zip(urls, local_paths):
+        if local_path is None:
+            continue
         url_to_local[source_url] = local_path
         manifest.append(
             {
@@ -1428,7 +1434,7 @@ async def data_analyst_node(state: dict, config: RunnableConfig) -> Command[Lite
         )
 
         failed_checks = _normalize_failed_checks(result.failed_checks)
-        if _looks_like_error_text(result.execution_log):
+        if looks_like_error_text(result.execution_log):
             failed_checks = _normalize_failed_checks(failed_checks + _data_analyst_failed_checks(kind="tool_execution"))
         result.failed_checks = failed_checks
         is_error = bool(failed_checks)
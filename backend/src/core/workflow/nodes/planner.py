@@ -29,6 +29,10 @@ RESEARCH_REQUIREMENT_KEYWORDS = (
     "史実",
     "資料",
 )
+_RESEARCH_REQUIREMENT_PATTERN = re.compile(
+    "|".join(map(re.escape, RESEARCH_REQUIREMENT_KEYWORDS)),
+    re.IGNORECASE,
+)
 
 COMIC_REQUIRED_SEQUENCE: tuple[tuple[str, str], ...] = (
     ("writer", "story_framework"),
@@ -321,8 +325,7 @@ def _step_text_blob(step: dict[str, Any]) -> str:
 
 
 def _contains_research_requirement(text: str) -> bool:
-    lowered = text.lower()
-    return any(keyword in text or keyword in lowered for keyword in RESEARCH_REQUIREMENT_KEYWORDS)
+    return _RESEARCH_REQUIREMENT_PATTERN.search(text) is not None
 
 
 def _has_explicit_research_step(plan_steps: list[dict[str, Any]]) -> bool:
@@ -1,10 +1,12 @@
 import asyncio
-import json
 import logging
 import os
 import re
+import time
+from functools import lru_cache
 from typing import Literal, Any
 
+from langchain_core.callbacks.manager import adispatch_custom_event
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 from langgraph.types import Command, Send
 from langgraph.graph import StateGraph, START, END
@@ -12,30 +14,70 @@ from langchain_core.runnables import RunnableConfig
 
 from src.infrastructure.llm.llm import astream_with_retry, get_llm_by_type
 from src.resources.prompts.template import load_prompt_markdown
+from src.shared.config.settings import settings
 from src.shared.schemas import (
     ResearchTask,
     ResearchResult,
     ResearchTaskList
 )
 from src.core.workflow.state import ResearchSubgraphState
-from .common import _update_artifact, run_structured_output
+from .common import _update_artifact, dumps_json, run_structured_output
 
 logger = logging.getLogger(__name__)
-VALID_SEARCH_MODES = {"text_search"}
+VALID_SEARCH_MODES = frozenset({"text_search"})
 try:
-    RESEARCH_TOKEN_FLUSH_CHARS = max(64, int(os.getenv("RESEARCH_TOKEN_FLUSH_CHARS", "256")))
+    RESEARCH_TOKEN_FLUSH_CHARS = max(64, int(os.getenv("RESEARCH_TOKEN_FLUSH_CHARS", "1024")))
 except Exception:
-    RESEARCH_TOKEN_FLUSH_CHARS = 256
+    RESEARCH_TOKEN_FLUSH_CHARS = 1024
+# Token flushes start small for a fast first paint and grow toward RESEARCH_TOKEN_FLUSH_CHARS.
+RESEARCH_TOKEN_FIRST_FLUSH_CHARS = 32
+RESEARCH_TOKEN_FLUSH_GROWTH = 3
 try:
     RESEARCH_TOKEN_FLUSH_INTERVAL_SEC = float(os.getenv("RESEARCH_TOKEN_FLUSH_INTERVAL_SEC", "0.4"))
 except Exception:
     RESEARCH_TOKEN_FLUSH_INTERVAL_SEC = 0.4
 RESEARCH_TOKEN_FLUSH_INTERVAL_SEC = max(0.05, min(2.0, RESEARCH_TOKEN_FLUSH_INTERVAL_SEC))
+# The interval flush reads the clock once per this many buffered chunks.
+RESEARCH_TOKEN_CLOCK_CHECK_CHUNKS = 4
+DEFAULT_RESEARCHER_CONCURRENCY = 3
+MAX_RESEARCH_SOURCES = 50
 DEFAULT_RESEARCH_PERSPECTIVES = (
     "市場動向・背景データの最新情報",
     "先行事例・ベストプラクティス",
     "実行時に考慮すべきリスク・制約条件",
 )
+_URL_PATTERN = re.compile(r"https?://[^\s\]\)<>\"']+")
+_LIST_MARKER_PATTERN = re.compile(r"^(?:[-*・]|[0-9]+[.)、])\s*")
+_PERSPECTIVE_SPLIT_PATTERN = re.compile(r"[、,\n/]")
+
+
+def _effective_research_concurrency() -> int:
+    configured = settings.RESEARCHER_CONCURRENCY
+    if isinstance(configured, int):
+        return max(1, configured)
+    return DEFAULT_RESEARCHER_CONCURRENCY
+
+
+def _build_worker_sends(
+    tasks: list[ResearchTask],
+    step_id: int,
+    step_title: str,
+    step_mode: str | None,
+) -> Send | list[Send]:
+    """Fan out one Send per task; a single task keeps the plain sequential Send."""
+    sends = [
+        Send(
+            "research_worker",
+            {
+                "task": task,
+                "step_id": step_id,
+                "step_title": step_title,
+                "step_mode": step_mode,
+            },
+        )
+        for task in tasks
+    ]
+    return sends[0] if len(sends) == 1 else sends
 
 
 def _normalize_search_mode(value: Any, default: str | None = "text_search") -> str | None:
@@ -53,7 +95,10 @@ def _normalize_task_modes_by_instruction(
 ) -> list[ResearchTask]:
     del instruction_text
     del preferred_mode
-    return [task.model_copy(update={"search_mode": "text_search"}) for task in tasks]
+    return [
+        task if task.search_mode == "text_search" else task.model_copy(update={"search_mode": "text_search"})
+        for task in tasks
+    ]
 
 
 def _extract_instruction_perspectives(instruction_text: str) -> list[str]:
@@ -73,7 +118,7 @@ def _extract_instruction_perspectives(instruction_text: str) -> list[str]:
         if "分解" in line and "調査" in line:
             continue
 
-        cleaned = re.sub(r"^(?:[-*・]|[0-9]+[.)、])\s*", "", line).strip()
+        cleaned = _LIST_MARKER_PATTERN.sub("", line).strip()
         if not cleaned:
             continue
         if cleaned not in perspectives:
@@ -89,8 +134,8 @@ def _extract_instruction_perspectives(instruction_text: str) -> list[str]:
         return []
 
     tail = instruction_text[marker_index:]
-    for chunk in re.split(r"[、,\n/]", tail):
-        cleaned = re.sub(r"^(?:[-*・]|[0-9]+[.)、])\s*", "", chunk).strip()
+    for chunk in _PERSPECTIVE_SPLIT_PATTERN.split(tail):
+        cleaned = _LIST_MARKER_PATTERN.sub("", chunk).strip()
         if not cleaned or cleaned.startswith("調査観点"):
             continue
         if "分解" in cleaned and "調査" in cleaned:
@@ -102,7 +147,8 @@ def _extract_instruction_perspectives(instruction_text: str) -> list[str]:
     return perspectives
 
 
-def _resolve_fallback_perspectives(instruction_text: str) -> list[str]:
+@lru_cache(maxsize=64)
+def _resolve_fallback_perspectives(instruction_text: str) -> tuple[str, ...]:
     extracted = _extract_instruction_perspectives(instruction_text)
     merged: list[str] = []
     for item in extracted + list(DEFAULT_RESEARCH_PERSPECTIVES):
@@ -114,7 +160,8 @@ def _resolve_fallback_perspectives(instruction_text: str) -> list[str]:
         merged.append(normalized)
         if len(merged) >= 3:
             break
-    return merged
+    # Cached: return an immutable tuple so callers cannot mutate the shared result.
+    return tuple(merged)
 
 
 def _build_fallback_research_tasks(
@@ -159,40 +206,48 @@ def _ensure_unique_task_ids(tasks: list[ResearchTask]) -> list[ResearchTask]:
     if not tasks:
         return []
 
-    seen: set[int] = set()
-    has_duplicate = False
-    for task in tasks:
-        if task.id in seen:
-            has_duplicate = True
-            break
-        seen.add(task.id)
-
-    if not has_duplicate:
+    if len({task.id for task in tasks}) == len(tasks):
         return tasks
 
     logger.warning(
         "Research Manager detected duplicate task IDs. Re-indexing tasks sequentially."
     )
-    return [task.model_copy(update={"id": idx}) for idx, task in enumerate(tasks, start=1)]
+    return [
+        task if task.id == idx else task.model_copy(update={"id": idx})
+        for idx, task in enumerate(tasks, start=1)
+    ]
+
+
+def _dedupe_query_hints(tasks: list[ResearchTask]) -> list[ResearchTask]:
+    """Drop query hints already claimed by an earlier sibling task (case-insensitive)."""
+    seen_hints: set[str] = set()
+    deduped: list[ResearchTask] = []
+    for task in tasks:
+        hints: list[str] = []
+        for hint in task.query_hints:
+            key = hint.strip().casefold()
+            if not key or key in seen_hints:
+                continue
+            seen_hints.add(key)
+            hints.append(hint)
+        deduped.append(task if hints == task.query_hints else task.model_copy(update={"query_hints": hints}))
+    return deduped
 
 
 def _extract_text_from_content(content: Any) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
+        # Gemini thinking models stream list content on every chunk, so keep this loop lean.
         texts: list[str] = []
         for part in content:
-            if isinstance(part, dict):
-                part_type = part.get("type")
-                if part_type == "text" and isinstance(part.get("text"), str):
-                    texts.append(part["text"])
-                elif part_type == "thinking":
-                    continue
-                elif isinstance(part.get("text"), str):
-                    texts.append(part["text"])
-            elif isinstance(part, str):
+            if isinstance(part, str):
                 texts.append(part)
-        return "".join(texts)
+            elif isinstance(part, dict) and part.get("type") != "thinking":
+                text = part.get("text")
+                if isinstance(text, str):
+                    texts.append(text)
+        return texts[0] if len(texts) == 1 else "".join(texts)
     if isinstance(content, dict):
         text = content.get("text")
         return text if isinstance(text, str) else ""
@@ -202,23 +257,20 @@ def _extract_text_from_content(content: Any) -> str:
 def _extract_urls(text: str) -> list[str]:
     if not text:
         return []
-    urls = re.findall(r"https?://[^\s\]\)<>\"']+", text)
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for url in urls:
-        cleaned = url.rstrip(".,);")
-        if cleaned and cleaned not in seen:
-            seen.add(cleaned)
-            deduped.append(cleaned)
-    return deduped
+    deduped: dict[str, None] = {}
+    for match in _URL_PATTERN.finditer(text):
+        cleaned = match.group(0).rstrip(".,);")
+        if cleaned and cleaned not in deduped:
+            deduped[cleaned] = None
+            if len(deduped) >= MAX_RESEARCH_SOURCES:
+                break
+    return list(deduped)
 
 
 async def research_worker_node(state: ResearchSubgraphState, config: RunnableConfig) -> dict:
     """
     Worker node for executing a single research task.
     """
-    from langchain_core.callbacks.manager import adispatch_custom_event
-
     task_data = state.get("task")
     if not task_data:
         logger.warning("Research Worker received empty task")
@@ -233,7 +285,8 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
     else:
         task = task_data
 
-    task_id = getattr(task, "id", "unknown")
+    task_id = task.id
+    task_search_mode = _normalize_search_mode(task.search_mode, default="text_search")
     logger.info(f"Worker executing task {task_id}: {task.perspective}")
     
     # Use step_id from state if provided (passed via Send), or fallback to plan search
@@ -250,6 +303,8 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
             step_id = "unknown"
     
     step_mode = _normalize_search_mode(state.get("step_mode"), default=None)
+    # Tail of the chained token dispatches; see flush_token_buffer.
+    token_dispatch: asyncio.Task | None = None
 
     try:
         # 1. Dispatch Start Event
@@ -258,14 +313,13 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
             {
                 "task_id": task.id,
                 "perspective": task.perspective,
-                "search_mode": _normalize_search_mode(getattr(task, "search_mode", "text_search"), default="text_search"),
+                "search_mode": task_search_mode,
             },
             config=config
         )
 
         system_prompt = load_prompt_markdown("researcher")
         
-        task_search_mode = _normalize_search_mode(getattr(task, "search_mode", "text_search"), default="text_search")
         search_mode = step_mode or task_search_mode or "text_search"
         instruction = (
             f"You are investigating: '{task.perspective}'.\n"
@@ -284,38 +338,56 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
         llm = get_llm_by_type("grounded")
         
         # Add run_name for better visibility in stream events
-        stream_config = config.copy()
-        stream_config["run_name"] = f"research_worker_{task_id}"
+        stream_config: RunnableConfig = {**config, "run_name": f"research_worker_{task_id}"}
         
         # 2. Stream Tokens
-        full_content = ""
-        token_buffer = ""
-        loop = asyncio.get_running_loop()
-        last_token_flush_at = loop.time()
+        content_parts: list[str] = []
+        token_parts: list[str] = []
+        token_chars = 0
+        token_has_line_break = False
+        token_flush_chars = min(RESEARCH_TOKEN_FIRST_FLUSH_CHARS, RESEARCH_TOKEN_FLUSH_CHARS)
+        token_chunks_since_clock_check = 0
+        last_token_flush_at = time.monotonic()
+
+        async def dispatch_token(previous: asyncio.Task | None, token: str) -> None:
+            if previous is not None:
+                # Awaiting (not just waiting on) the previous link re-raises its failure,
+                # so the first failed dispatch propagates down the chain to the tail.
+                await previous
+            await adispatch_custom_event(
+                "research_worker_token",
+                {"task_id": task.id, "token": token},
+                config=config
+            )
 
         async def flush_token_buffer(force: bool = False) -> None:
-            nonlocal token_buffer, last_token_flush_at
-            if not token_buffer:
+            nonlocal token_chars, token_has_line_break, token_flush_chars, last_token_flush_at
+            nonlocal token_dispatch, token_chunks_since_clock_check
+            if not token_parts:
                 return
 
-            now = loop.time()
-            if not force:
-                has_line_break = "\n" in token_buffer
-                should_flush = (
-                    len(token_buffer) >= RESEARCH_TOKEN_FLUSH_CHARS
-                    or (now - last_token_flush_at) >= RESEARCH_TOKEN_FLUSH_INTERVAL_SEC
-                    or has_line_break
-                )
-                if not should_flush:
+            if not force and token_chars < token_flush_chars and not token_has_line_break:
+                # Size and line-break triggers missed; check the interval only every few chunks.
+                token_chunks_since_clock_check += 1
+                if token_chunks_since_clock_check < RESEARCH_TOKEN_CLOCK_CHECK_CHUNKS:
+                    return
+                token_chunks_since_clock_check = 0
+                if (time.monotonic() - last_token_flush_at) < RESEARCH_TOKEN_FLUSH_INTERVAL_SEC:
                     return
 
-            await adispatch_custom_event(
-                "research_worker_token",
-                {"task_id": task.id, "token": token_buffer},
-                config=config
-            )
-            token_buffer = ""
-            last_token_flush_at = now
+            # Surface an earlier failed dispatch now rather than after the whole stream.
+            if token_dispatch is not None and token_dispatch.done():
+                token_dispatch.result()
+
+            # Dispatch without blocking the LLM stream; each dispatch waits for the previous
+            # one so token events still reach consumers in order.
+            token_dispatch = asyncio.create_task(dispatch_token(token_dispatch, "".join(token_parts)))
+            token_parts.clear()
+            token_chars = 0
+            token_has_line_break = False
+            token_flush_chars = min(RESEARCH_TOKEN_FLUSH_CHARS, token_flush_chars * RESEARCH_TOKEN_FLUSH_GROWTH)
+            token_chunks_since_clock_check = 0
+            last_token_flush_at = time.monotonic()
 
         async for chunk in astream_with_retry(
             lambda: llm.astream(messages, config=stream_config),
@@ -326,11 +398,16 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
                 text_chunk = _extract_text_from_content(chunk.content)
                 if not text_chunk:
                     continue
-                full_content += text_chunk
-                token_buffer += text_chunk
+                content_parts.append(text_chunk)
+                token_parts.append(text_chunk)
+                token_chars += len(text_chunk)
+                token_has_line_break = token_has_line_break or "\n" in text_chunk
                 await flush_token_buffer()
 
         await flush_token_buffer(force=True)
+        if token_dispatch is not None:
+            await token_dispatch
+        full_content = "".join(content_parts)
 
         sources = _extract_urls(full_content)
 
@@ -373,12 +450,11 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
             "artifacts": _update_artifact(
                 state,
                 artifact_id,
-                json.dumps(
+                dumps_json(
                     {
                         **result.model_dump(exclude_none=True),
                         "search_mode": search_mode,
-                    },
-                    ensure_ascii=False,
+                    }
                 ),
             ),
             "messages": [
@@ -409,6 +485,11 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
     except Exception as e:
         logger.error(f"Research worker {task_id} failed: {e}")
         error_message = f"Research worker failed: {e}"
+        if token_dispatch is not None:
+            try:
+                await token_dispatch
+            except Exception as dispatch_error:
+                logger.warning(f"Research worker {task_id} token dispatch failed: {dispatch_error}")
         try:
             await adispatch_custom_event(
                 "data-research-report",
@@ -416,7 +497,7 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
                     "artifact_id": f"step_{step_id}_research_{task.id}",
                     "task_id": task.id,
                     "perspective": task.perspective,
-                    "search_mode": _normalize_search_mode(getattr(task, "search_mode", "text_search"), default="text_search"),
+                    "search_mode": task_search_mode,
                     "status": "failed",
                     "report": error_message,
                     "sources": [],
@@ -442,24 +523,32 @@ async def research_worker_node(state: ResearchSubgraphState, config: RunnableCon
                 )
             ]
         }
+    finally:
+        # On cancellation the chain may still be pending; stop it so no token events
+        # are sent for a run that has already ended. Cancelling the tail cascades down.
+        if token_dispatch is not None and not token_dispatch.done():
+            token_dispatch.cancel()
 
 async def research_manager_node(state: ResearchSubgraphState, config: RunnableConfig) -> Command[Literal["research_worker", "__end__"]]:
     """
     Manager Node (Orchestrator). 
-    Handles decomposition and sequential dispatch of workers.
+    Handles decomposition and batched dispatch of workers.
+    Up to RESEARCHER_CONCURRENCY tasks run in parallel per batch (1 = sequential).
     """
     logger.info(f"Research Manager active. Decomposed: {state.get('is_decomposed', False)}")
 
-    try:
-        _step_index, current_step = next(
-            (i, step) for i, step in enumerate(state["plan"]) 
-            if step.get("status") == "in_progress"
-            and step.get("capability") == "researcher"
-        )
-    except StopIteration:
+    current_step = None
+    for step in state["plan"]:
+        if step.get("status") == "in_progress" and step.get("capability") == "researcher":
+            current_step = step
+            break
+    if current_step is None:
         logger.error("Research Manager called but no in_progress step found.")
         return Command(goto=END, update={})
-        
+
+    step_id = current_step["id"]
+    step_title = current_step.get("title") or current_step.get("description") or "research"
+    step_mode = _normalize_search_mode(current_step.get("mode"), default=None)
     internal_tasks = state.get("internal_research_tasks", [])
     results = state.get("internal_research_results", [])
     current_idx_raw = state.get("current_task_index", 0)
@@ -473,7 +562,6 @@ async def research_manager_node(state: ResearchSubgraphState, config: RunnableCo
         
         base_prompt = load_prompt_markdown("research_topic_analyzer")
         step_instruction = str(current_step.get("instruction") or "")
-        step_mode = _normalize_search_mode(current_step.get("mode"), default=None)
         instruction_content = f"User Instruction: {step_instruction}"
         
         llm = get_llm_by_type("reasoning")
@@ -486,8 +574,7 @@ async def research_manager_node(state: ResearchSubgraphState, config: RunnableCo
             ]
             
             # Add run_name for better visibility in stream events
-            stream_config = config.copy()
-            stream_config["run_name"] = "researcher"
+            stream_config: RunnableConfig = {**config, "run_name": "researcher"}
             
             qa_result: ResearchTaskList = await run_structured_output(
                 llm=llm,
@@ -509,24 +596,18 @@ async def research_manager_node(state: ResearchSubgraphState, config: RunnableCo
             logger.warning(f"Decomposition failed: {e}. Fallback to multi-perspective tasks.")
             tasks = _build_fallback_research_tasks(step_instruction, step_mode)
             tasks = _ensure_unique_task_ids(tasks)
+        # Sibling workers run grounded search independently; don't let them repeat a query.
+        tasks = _dedupe_query_hints(tasks)
 
         logger.info(f"Manager: Decomposition complete. {len(tasks)} tasks generated.")
-        # [Serialization] Start sequential execution from the first task
-        first_task = tasks[0]
+        # Fan out the first batch; the manager runs again once the whole batch has finished.
+        first_batch = tasks[:_effective_research_concurrency()]
         return Command(
-            goto=Send(
-                "research_worker",
-                {
-                    "task": first_task,
-                    "step_id": current_step["id"],
-                    "step_title": current_step.get("title") or current_step.get("description") or "research",
-                    "step_mode": step_mode,
-                },
-            ),
+            goto=_build_worker_sends(first_batch, step_id, step_title, step_mode),
             update={
                 "internal_research_tasks": tasks,
                 "is_decomposed": True,
-                "current_task_index": 1,  # Next task index
+                "current_task_index": len(first_batch),  # Next task index
                 **clear_update
             }
         )
@@ -542,24 +623,21 @@ async def research_manager_node(state: ResearchSubgraphState, config: RunnableCo
         current_idx = result_count
 
     if current_idx < task_count:
-        logger.info(f"Manager: Dispatching next task ({current_idx + 1}/{task_count})")
-        next_task = internal_tasks[current_idx]
+        next_batch = internal_tasks[current_idx:current_idx + _effective_research_concurrency()]
+        logger.info(
+            "Manager: Dispatching tasks %s-%s/%s",
+            current_idx + 1,
+            current_idx + len(next_batch),
+            task_count,
+        )
         return Command(
-            goto=Send(
-                "research_worker",
-                {
-                    "task": next_task,
-                    "step_id": current_step["id"],
-                    "step_title": current_step.get("title") or current_step.get("description") or "research",
-                    "step_mode": _normalize_search_mode(current_step.get("mode"), default=None),
-                },
-            ),
+            goto=_build_worker_sends(next_batch, step_id, step_title, step_mode),
             update={
-                "current_task_index": current_idx + 1
+                "current_task_index": current_idx + len(next_batch)
             }
         )
 
-    # Check if all workers finished (safety check, though in sequential it should be true here)
+    # Check if all workers finished (every dispatched batch has reported back)
     if result_count >= task_count and task_count > 0:
         logger.info("Manager: All workers finished. Finalizing step.")
 
@@ -590,15 +668,14 @@ async def research_manager_node(state: ResearchSubgraphState, config: RunnableCo
             update={
                 "artifacts": _update_artifact(
                     state,
-                    f"step_{current_step['id']}_research",
-                    json.dumps(
+                    f"step_{step_id}_research",
+                    dumps_json(
                         {
                             "summary": summary_text,
                             "total_tasks": len(results),
                             "completed_tasks": completed_results,
                             "failed_tasks": failed_results,
-                        },
-                        ensure_ascii=False,
+                        }
                     ),
                 ),
                 "internal_research_tasks": [], 
@@ -623,8 +700,8 @@ async def research_manager_node(state: ResearchSubgraphState, config: RunnableCo
         update={
             "artifacts": _update_artifact(
                 state,
-                f"step_{current_step['id']}_research",
-                json.dumps(
+                f"step_{step_id}_research",
+                dumps_json(
                     {
                         "error": mismatch_message,
                         "notes": mismatch_message,
@@ -633,8 +710,7 @@ async def research_manager_node(state: ResearchSubgraphState, config: RunnableCo
                         "total_tasks": task_count,
                         "completed_tasks": result_count,
                         "failed_tasks": failed_tasks,
-                    },
-                    ensure_ascii=False,
+                    }
                 ),
             ),
             "internal_research_tasks": [],
@@ -654,7 +730,7 @@ def build_researcher_subgraph():
     workflow.add_node("research_worker", research_worker_node)
     
     workflow.add_edge(START, "manager")
-    # In sequential flow, worker always returns to manager to check for next task
+    # Workers of a batch run in parallel; the manager resumes once all of them return
     workflow.add_edge("research_worker", "manager")
     
     return workflow.compile()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import json
 import re
@@ -13,7 +14,13 @@ from src.infrastructure.llm.llm import astream_with_retry, get_llm_by_type
 from src.resources.prompts.template import apply_prompt_template
 from src.core.workflow.state import State
 from src.core.workflow.step_v2 import capability_from_any, plan_steps_for_ui
-from .common import run_structured_output, resolve_step_dependency_context, build_step_asset_pool
+from .common import (
+    build_step_asset_pool,
+    dumps_json,
+    looks_like_error_text,
+    resolve_step_dependency_context,
+    run_structured_output,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +30,12 @@ CAPABILITY_TO_DESTINATION = {
     "visualizer": "visualizer",
     "data_analyst": "data_analyst",
 }
+CAPABILITY_TO_ARTIFACT_SUFFIX = {
+    "writer": "story",
+    "visualizer": "visual",
+    "researcher": "research",
+    "data_analyst": "data",
+}
 MAX_SELECTED_ASSETS_PER_STEP = 8
 
 
@@ -206,20 +219,13 @@ def _normalize_plan_statuses(plan: list[dict]) -> None:
             step["status"] = "pending"
 
 
-def _looks_like_error_text(text: str | None) -> bool:
-    if not isinstance(text, str):
-        return False
-    lowered = text.lower()
-    return "error" in lowered or "失敗" in text or "エラー" in text or "failed" in lowered
-
-
 def _result_summary_indicates_failure(text: str | None) -> bool:
     if not isinstance(text, str):
         return False
     trimmed = text.strip()
     if not trimmed:
         return False
-    if _looks_like_error_text(trimmed):
+    if looks_like_error_text(trimmed):
         return True
 
     lowered = trimmed.lower()
@@ -287,14 +293,8 @@ def _resolve_worker_destination(step: dict) -> str | None:
 
 def _artifact_suffix_for_step(step: dict) -> str:
     capability = step.get("capability")
-    if capability == "writer":
-        return "story"
-    if capability == "visualizer":
-        return "visual"
-    if capability == "researcher":
-        return "research"
-    if capability == "data_analyst":
-        return "data"
+    if isinstance(capability, str):
+        return CAPABILITY_TO_ARTIFACT_SUFFIX.get(capability, "output")
     return "output"
 
 
@@ -361,13 +361,15 @@ def _extract_failure_metadata(current_step: dict, artifact_value: object) -> tup
 
     parsed = artifact_value
     if isinstance(artifact_value, str):
-        if _looks_like_error_text(artifact_value):
+        if looks_like_error_text(artifact_value):
             failed = True
             notes = artifact_value
-        try:
-            parsed = json.loads(artifact_value)
-        except Exception:
-            parsed = artifact_value
+        # Only JSON objects carry failure fields; skip parsing prose artifacts outright.
+        if artifact_value.lstrip().startswith("{"):
+            try:
+                parsed = json.loads(artifact_value)
+            except Exception:
+                parsed = artifact_value
 
     if isinstance(parsed, dict):
         if parsed.get("error"):
@@ -719,14 +721,13 @@ async def _select_assets_for_step(
                     "出力はStepAssetBindingSelectionスキーマに厳密準拠してください。"
                 )
             ),
-            HumanMessage(content=json.dumps(selector_input, ensure_ascii=False), name="supervisor"),
+            HumanMessage(content=dumps_json(selector_input), name="supervisor"),
         ]
 
         selected_bindings: list[dict[str, Any]] = []
         try:
             llm = get_llm_by_type("reasoning")
-            stream_config = config.copy()
-            stream_config["run_name"] = "supervisor_asset_requirement_resolver"
+            stream_config = {**config, "run_name": "supervisor_asset_requirement_resolver"}
             selection = await run_structured_output(
                 llm=llm,
                 schema=StepAssetBindingSelection,
@@ -853,14 +854,13 @@ async def _select_assets_for_step(
                 "出力はStepAssetSelectionスキーマに厳密準拠してください。"
             )
         ),
-        HumanMessage(content=json.dumps(selector_input, ensure_ascii=False), name="supervisor"),
+        HumanMessage(content=dumps_json(selector_input), name="supervisor"),
     ]
 
     selected_ids: list[str] = []
     try:
         llm = get_llm_by_type("reasoning")
-        stream_config = config.copy()
-        stream_config["run_name"] = "supervisor_asset_selector"
+        stream_config = {**config, "run_name": "supervisor_asset_selector"}
         selection = await run_structured_output(
             llm=llm,
             schema=StepAssetSelection,
@@ -886,19 +886,48 @@ async def _select_assets_for_step(
 
     return asset_pool, selected_ids, []
 
+async def _select_assets_or_fallback(
+    *,
+    state: State,
+    step: dict[str, Any],
+    dependency_context: dict[str, Any],
+    config: RunnableConfig,
+) -> tuple[dict[str, dict[str, Any]], list[str], list[dict[str, Any]]]:
+    """Run asset selection, falling back to rule-based selection instead of raising."""
+    try:
+        return await _select_assets_for_step(
+            state=state,
+            step=step,
+            dependency_context=dependency_context,
+            config=config,
+        )
+    except Exception as e:
+        logger.warning("Supervisor asset selection failed, fallback selection is applied: %s", e)
+
+    try:
+        asset_pool = build_step_asset_pool(state, current_step=step, dependency_context=dependency_context)
+    except Exception as e:
+        logger.warning("Supervisor asset pool could not be built: %s", e)
+        return {}, [], []
+    return asset_pool, _fallback_selected_asset_ids(step, asset_pool), []
+
+
 async def _generate_supervisor_report(
     state: State,
     config: RunnableConfig,
     is_final: bool = False,
     report_event: str = "step_completed",
 ) -> str:
-    """Generate a dynamic status report using the basic LLM."""
+    """Generate a dynamic status report using the basic LLM.
+
+    Expects plan statuses already normalized by supervisor_node, its only caller.
+    """
     try:
         plan = state.get("plan", [])
-        _normalize_plan_statuses(plan)
         
         prompt_name = "supervisor"
-        enriched_state = state.copy()
+        # The report prompt reads only the variables set below, so skip copying the full state.
+        enriched_state: dict[str, Any] = {"product_type": state.get("product_type")}
 
         if is_final:
             prompt_name = "supervisor_final"
@@ -951,26 +980,18 @@ async def _generate_supervisor_report(
         llm = get_llm_by_type("basic")
         
         # Use astream to ensure events are emitted
-        response_content = ""
+        response_parts: list[str] = []
         # Add run_name for better visibility in stream events
-        stream_config = config.copy()
-        stream_config["run_name"] = "supervisor"
+        stream_config = {**config, "run_name": "supervisor"}
         
         async for chunk in astream_with_retry(
             lambda: llm.astream(messages, config=stream_config),
             operation_name="supervisor.astream",
         ):
             if chunk.content:
-                if isinstance(chunk.content, list):
-                    for part in chunk.content:
-                        if isinstance(part, dict) and "text" in part:
-                            response_content += part["text"]
-                        elif isinstance(part, str):
-                            response_content += part
-                else:
-                    response_content += str(chunk.content)
+                response_parts.append(_extract_text_from_content(chunk.content))
             
-        return response_content
+        return "".join(response_parts)
     except Exception as e:
         logger.error(f"Failed to generate supervisor report: {e}")
         return "進捗を確認しました。続いて次の制作工程に進みます。"
@@ -1025,13 +1046,15 @@ async def _dispatch_plan_step_ended(step: dict, status: str, config: RunnableCon
 
 
 def _find_current_step(plan: list[dict[str, Any]]) -> tuple[int, dict[str, Any] | None]:
+    """Return the in_progress step, else the first pending one, in a single pass."""
+    pending_index, pending_step = -1, None
     for index, step in enumerate(plan):
-        if step.get("status") == "in_progress":
-            return index, step
-    for index, step in enumerate(plan):
-        if step.get("status") == "pending":
+        status = step.get("status")
+        if status == "in_progress":
             return index, step
-    return -1, None
+        if status == "pending" and pending_step is None:
+            pending_index, pending_step = index, step
+    return pending_index, pending_step
 
 
 async def supervisor_node(state: State, config: RunnableConfig) -> Command:
@@ -1106,13 +1129,26 @@ async def supervisor_node(state: State, config: RunnableConfig) -> Command:
 
         logger.info(f"Starting Step {current_step_index} ({destination})")
 
+        plan[current_step_index]["status"] = "in_progress"
+        await _dispatch_plan_step_started(current_step, config)
+        await _dispatch_plan_update(plan, config)
+
+        # Asset selection and the step-start report are independent LLM calls; run them together.
         dependency_context = resolve_step_dependency_context(state, current_step)
-        step_asset_pool, selected_asset_ids, selected_asset_bindings = await _select_assets_for_step(
-            state=state,
-            step=current_step,
-            dependency_context=dependency_context,
-            config=config,
-        )
+        async with asyncio.TaskGroup() as task_group:
+            selection_task = task_group.create_task(
+                _select_assets_or_fallback(
+                    state=state,
+                    step=current_step,
+                    dependency_context=dependency_context,
+                    config=config,
+                )
+            )
+            report_task = task_group.create_task(
+                _generate_supervisor_report(state, config, report_event="step_started")
+            )
+        step_asset_pool, selected_asset_ids, selected_asset_bindings = selection_task.result()
+        report = report_task.result()
         asset_catalog = dict(state.get("asset_catalog") or {})
         asset_catalog.update(step_asset_pool)
         candidate_assets_by_step = dict(state.get("candidate_assets_by_step") or {})
@@ -1124,8 +1160,6 @@ async def supervisor_node(state: State, config: RunnableConfig) -> Command:
             selected_assets_by_step[str(step_id)] = selected_asset_ids
             asset_bindings_by_step[str(step_id)] = selected_asset_bindings
 
-        plan[current_step_index]["status"] = "in_progress"
-        await _dispatch_plan_step_started(current_step, config)
         try:
             await adispatch_custom_event(
                 "data-step-assets-selected",
@@ -1141,11 +1175,6 @@ async def supervisor_node(state: State, config: RunnableConfig) -> Command:
         except Exception as e:
             logger.warning("Failed to dispatch selected assets event: %s", e)
 
-        await _dispatch_plan_update(plan, config)
-        
-        # Generate report for next step
-        report = await _generate_supervisor_report(state, config, report_event="step_started")
-
         return Command(
             goto=destination,
             update={
@@ -8,6 +8,7 @@ from langchain_core.callbacks.manager import adispatch_custom_event
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import Command
+from pydantic import ValidationError
 
 from src.core.workflow.state import State
 from src.infrastructure.llm.llm import astream_with_retry, get_llm_by_type
@@ -25,6 +26,8 @@ from src.shared.schemas import (
 from .common import (
     build_worker_error_payload,
     create_worker_response,
+    decode_first_json_object,
+    dumps_json,
     extract_first_json,
     resolve_asset_bindings_for_step,
     resolve_step_dependency_context,
@@ -215,7 +218,7 @@ async def writer_node(state: State, config: RunnableConfig) -> Command[Literal["
     messages = apply_prompt_template("writer", prompt_state)
     messages.append(
         HumanMessage(
-            content=json.dumps(context_payload, ensure_ascii=False, indent=2),
+            content=dumps_json(context_payload, indent=True),
             name="supervisor",
         )
     )
@@ -223,10 +226,9 @@ async def writer_node(state: State, config: RunnableConfig) -> Command[Literal["
     llm = get_llm_by_type(AGENT_LLM_MAP["writer"])
 
     try:
-        stream_config = config.copy()
-        stream_config["run_name"] = "writer"
+        stream_config = {**config, "run_name": "writer"}
 
-        full_text = ""
+        text_parts: list[str] = []
         async for chunk in astream_with_retry(
             lambda: llm.astream(messages, config=stream_config),
             operation_name="writer.astream",
@@ -235,20 +237,31 @@ async def writer_node(state: State, config: RunnableConfig) -> Command[Literal["
                 continue
             _, text = split_content_parts(chunk.content)
             if text:
-                full_text += text
+                text_parts.append(text)
+        full_text = "".join(text_parts)
 
         try:
             json_text = extract_first_json(full_text) or full_text
             writer_output = schema.model_validate_json(json_text)
-        except Exception as parse_error:
-            logger.warning("Writer streaming JSON parse failed: %s. Falling back to repair.", parse_error)
-            writer_output = await run_structured_output(
-                llm=llm,
-                schema=schema,
-                messages=messages,
-                config=stream_config,
-                repair_hint=f"Schema: {schema.__name__}. No extra text.",
-            )
+        except ValidationError as parse_error:
+            writer_output = None
+            # Prose after the JSON object breaks the greedy extraction; decoding just the
+            # leading object recovers it without another LLM round trip.
+            leading_json = decode_first_json_object(full_text)
+            if leading_json is not None:
+                try:
+                    writer_output = schema.model_validate(leading_json)
+                except ValidationError:
+                    pass
+            if writer_output is None:
+                logger.warning("Writer streaming JSON parse failed: %s. Falling back to repair.", parse_error)
+                writer_output = await run_structured_output(
+                    llm=llm,
+                    schema=schema,
+                    messages=messages,
+                    config=stream_config,
+                    repair_hint=f"Schema: {schema.__name__}. No extra text.",
+                )
 
         if (
             state.get("product_type") == "slide"
@@ -277,7 +290,7 @@ async def writer_node(state: State, config: RunnableConfig) -> Command[Literal["
                         messages=[
                             *messages,
                             HumanMessage(
-                                content=json.dumps(quality_gate_payload, ensure_ascii=False, indent=2),
+                                content=dumps_json(quality_gate_payload, indent=True),
                                 name="quality_gate",
                             ),
                         ],
@@ -305,7 +318,8 @@ async def writer_node(state: State, config: RunnableConfig) -> Command[Literal["
             else execution_summary
         )
 
-        content_json = writer_output.model_dump_json(exclude_none=True)
+        writer_payload = writer_output.model_dump(mode="json", exclude_none=True)
+        content_json = dumps_json(writer_payload)
         artifact_id = f"step_{current_step['id']}_story"
         artifact_type = WRITER_MODE_TO_ARTIFACT_TYPE.get(mode, "report")
         state["plan"][step_index]["result_summary"] = execution_summary
@@ -319,7 +333,7 @@ async def writer_node(state: State, config: RunnableConfig) -> Command[Literal["
                     "artifact_type": artifact_type,
                     "mode": mode,
                     "status": "completed",
-                    "output": writer_output.model_dump(exclude_none=True),
+                    "output": writer_payload,
                 },
                 config=config,
             )
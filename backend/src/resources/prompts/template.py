@@ -1,6 +1,7 @@
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -84,9 +85,11 @@ def get_prompt_template(prompt_name: str) -> str:
     raise FileNotFoundError(f"No .md files found in prompt directory: {prompt_name}")
 
 
+@lru_cache(maxsize=None)
 def load_prompt_markdown(prompt_name: str) -> str:
     """
     [互換性維持用] プロンプトMarkdownファイルを変数置換なしでプレーンテキストとして読み込む。
+    プロンプトは静的ファイルのためプロセス内でキャッシュする（再読込は load_prompt_markdown.cache_clear()）。
     """
     prompt_dir = _PROMPTS_DIR / prompt_name
     if not prompt_dir.is_dir():
@@ -107,24 +110,12 @@ def load_prompt_markdown(prompt_name: str) -> str:
     raise FileNotFoundError(f"No .md files found in prompt directory: {prompt_name}")
 
 
-def apply_prompt_template(prompt_name: str, state: AgentState) -> list[Any]:
+@lru_cache(maxsize=128)
+def _load_prompt_template(prompt_name: str, product_type: str | None, mode: str | None) -> PromptTemplate:
     """
-    プロンプト構成を結合し、状態変数を適用してシステムメッセージを生成する。
-    1. {prompt_name}/base.md
-    2. mode指定時は mode専用ファイル（優先）:
-       - {prompt_name}/{product_type}/{mode}.md
-       - {prompt_name}/{product_type}_{mode}.md
-       - {prompt_name}/{mode}.md
-       mode未指定時は一部プロンプトで product_type ごとの既定 mode を補完する。
-    3. mode専用がなければ {prompt_name}/{product_type}.md
-    4. どちらもない場合は default.md または既存ファイル
+    プロンプト構成ファイルを結合し、LangChain用の PromptTemplate を返す。
+    ファイル読込とテンプレート解析はプロセス内でキャッシュする（再読込は _load_prompt_template.cache_clear()）。
     """
-    product_type = state.get("product_type")
-    mode = state.get("mode")
-    resolved_mode = mode
-    if not (isinstance(mode, str) and mode.strip()):
-        product_key = str(product_type).strip() if isinstance(product_type, str) else ""
-        resolved_mode = _MODE_FALLBACK_BY_PROMPT_AND_PRODUCT.get(prompt_name, {}).get(product_key)
     prompt_dir = _PROMPTS_DIR / prompt_name
     
     parts = []
@@ -139,7 +130,7 @@ def apply_prompt_template(prompt_name: str, state: AgentState) -> list[Any]:
         specific_path = _resolve_specific_prompt_path(
             prompt_dir=prompt_dir,
             product_type=product_type,
-            mode=resolved_mode,
+            mode=mode,
         )
         if specific_path is not None:
             parts.append(specific_path.read_text(encoding="utf-8"))
@@ -162,14 +153,41 @@ def apply_prompt_template(prompt_name: str, state: AgentState) -> list[Any]:
     else:
         full_content = "\n\n".join(parts)
 
+    return PromptTemplate(
+        input_variables=["CURRENT_TIME"],
+        template=_format_prompt_for_langchain(full_content),
+    )
+
+
+def apply_prompt_template(prompt_name: str, state: AgentState) -> list[Any]:
+    """
+    プロンプト構成を結合し、状態変数を適用してシステムメッセージを生成する。
+    1. {prompt_name}/base.md
+    2. mode指定時は mode専用ファイル（優先）:
+       - {prompt_name}/{product_type}/{mode}.md
+       - {prompt_name}/{product_type}_{mode}.md
+       - {prompt_name}/{mode}.md
+       mode未指定時は一部プロンプトで product_type ごとの既定 mode を補完する。
+    3. mode専用がなければ {prompt_name}/{product_type}.md
+    4. どちらもない場合は default.md または既存ファイル
+    """
+    product_type = state.get("product_type")
+    mode = state.get("mode")
+    resolved_mode = mode
+    if not (isinstance(mode, str) and mode.strip()):
+        product_key = str(product_type).strip() if isinstance(product_type, str) else ""
+        resolved_mode = _MODE_FALLBACK_BY_PROMPT_AND_PRODUCT.get(prompt_name, {}).get(product_key)
+    prompt_template = _load_prompt_template(
+        prompt_name,
+        product_type if isinstance(product_type, str) else None,
+        resolved_mode if isinstance(resolved_mode, str) else None,
+    )
+
     prompt_state = dict(state)
     if resolved_mode and not (isinstance(prompt_state.get("mode"), str) and str(prompt_state.get("mode")).strip()):
         prompt_state["mode"] = resolved_mode
 
-    system_prompt: str = PromptTemplate(
-        input_variables=["CURRENT_TIME"],
-        template=_format_prompt_for_langchain(full_content),
-    ).format(
+    system_prompt: str = prompt_template.format(
         CURRENT_TIME=datetime.now().strftime("%a %b %d %Y %H:%M:%S %z"),
         **prompt_state
     )
@@ -1,4 +1,5 @@
 import asyncio
+import time
 import json
 from pathlib import Path
 
@@ -508,3 +509,41 @@ def test_extract_visualizer_generated_image_urls_supports_pages_and_characters()
         "https://example.com/character-1.png",
         "https://example.com/page-2.png",
     ]
+
+
+def test_download_input_files_keeps_input_order_when_fetches_finish_out_of_order(
+    monkeypatch, tmp_path: Path
+) -> None:
+    urls = [
+        "https://storage.googleapis.com/bucket/a.csv",
+        "https://storage.googleapis.com/bucket/missing.csv",
+        "https://storage.googleapis.com/bucket/c.xlsx",
+        "https://storage.googleapis.com/bucket/d.png",
+    ]
+    delays = {urls[0]: 0.15, urls[1]: 0.05, urls[2]: 0.1, urls[3]: 0.0}
+    completed: list[str] = []
+
+    def _fake_download(url: str) -> bytes | None:
+        time.sleep(delays[url])
+        completed.append(url)
+        if url == urls[1]:
+            return None
+        return url.encode("utf-8")
+
+    monkeypatch.setattr(data_analyst_module, "download_blob_as_bytes", _fake_download)
+
+    url_to_local, manifest = asyncio.run(
+        data_analyst_module._download_input_files(workspace_dir=str(tmp_path), urls=urls)
+    )
+
+    assert completed != urls
+    assert [item["source_url"] for item in manifest] == [urls[0], urls[2], urls[3]]
+    assert [Path(item["local_path"]).name for item in manifest] == [
+        "001_a.csv",
+        "003_c.xlsx",
+        "004_d.png",
+    ]
+    assert urls[1] not in url_to_local
+    for item in manifest:
+        assert url_to_local[item["source_url"]] == item["local_path"]
+        assert Path(item["local_path"]).read_bytes() == item["source_url"].encode("utf-8")
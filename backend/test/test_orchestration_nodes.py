@@ -1,8 +1,15 @@
 import asyncio
 import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
-from src.core.workflow.nodes.supervisor import supervisor_node
+from src.core.workflow.nodes.supervisor import (
+    _extract_failure_metadata,
+    _find_current_step,
+    _generate_supervisor_report,
+    supervisor_node,
+)
+from src.core.workflow.nodes.common import looks_like_error_text
 
 
 def test_supervisor_captures_explicit_failed_checks_from_artifact() -> None:
@@ -145,6 +152,63 @@ def test_supervisor_routes_visualizer_all_images_failed_to_retry_node() -> None:
     assert cmd.update["plan"][0]["status"] == "completed"
 
 
+def test_find_current_step_prefers_in_progress_over_earlier_pending() -> None:
+    plan = [
+        {"id": 1, "status": "completed"},
+        {"id": 2, "status": "pending"},
+        {"id": 3, "status": "in_progress"},
+        {"id": 4, "status": "pending"},
+    ]
+    assert _find_current_step(plan) == (2, plan[2])
+
+    plan[2]["status"] = "completed"
+    assert _find_current_step(plan) == (1, plan[1])
+
+    plan[1]["status"] = plan[3]["status"] = "completed"
+    assert _find_current_step(plan) == (-1, None)
+
+
+def test_looks_like_error_text_matches_keywords_case_insensitively() -> None:
+    assert looks_like_error_text("Step FAILED after retry")
+    assert looks_like_error_text("Error: timeout")
+    assert looks_like_error_text("画像生成に失敗しました")
+    assert looks_like_error_text("エラーが発生しました")
+    assert not looks_like_error_text("スライド構成を作成しました")
+    assert not looks_like_error_text(None)
+
+
+def test_extract_failure_metadata_reads_json_objects_and_skips_prose() -> None:
+    step = {"capability": "writer"}
+
+    failed, checks, notes = _extract_failure_metadata(
+        step, '  {"error": "missing", "failed_checks": ["missing_research"]}'
+    )
+    assert (failed, checks, notes) == (True, ["missing_research"], "missing")
+
+    assert _extract_failure_metadata(step, "構成を作成しました。") == (False, [], None)
+
+
+def test_supervisor_report_joins_string_and_list_content_chunks() -> None:
+    class _StreamingLLM:
+        async def astream(self, messages, config=None):
+            yield SimpleNamespace(content="調査が")
+            yield SimpleNamespace(content=[{"type": "text", "text": "完了し"}, "ました。"])
+            yield SimpleNamespace(content="")
+
+    state = {
+        "messages": [],
+        "plan": [
+            {"id": 1, "status": "completed", "title": "調査", "result_summary": "ok"},
+            {"id": 2, "status": "in_progress", "title": "構成", "instruction": "構成を作る"},
+        ],
+        "artifacts": {},
+    }
+    with patch("src.core.workflow.nodes.supervisor.get_llm_by_type", return_value=_StreamingLLM()):
+        report = asyncio.run(_generate_supervisor_report(state, {}))
+
+    assert report == "調査が完了しました。"
+
+
 def test_supervisor_emits_plan_step_started_event_for_pending_step() -> None:
     state = {
         "messages": [],
@@ -176,6 +240,88 @@ def test_supervisor_emits_plan_step_started_event_for_pending_step() -> None:
     assert start_call.args[1]["status"] == "in_progress"
 
 
+def test_supervisor_runs_asset_selection_and_start_report_concurrently() -> None:
+    state = {
+        "messages": [],
+        "plan": [
+            {
+                "id": 1,
+                "capability": "writer",
+                "status": "pending",
+                "title": "Story",
+                "instruction": "Write story",
+            }
+        ],
+        "artifacts": {},
+    }
+
+    async def _run() -> tuple:
+        selection_started = asyncio.Event()
+        report_started = asyncio.Event()
+
+        async def _select(**kwargs):
+            selection_started.set()
+            await asyncio.wait_for(report_started.wait(), timeout=1)
+            return {}, ["asset-1"], []
+
+        async def _report(*args, **kwargs):
+            report_started.set()
+            await asyncio.wait_for(selection_started.wait(), timeout=1)
+            return "started"
+
+        with patch("src.core.workflow.nodes.supervisor.adispatch_custom_event", new=AsyncMock()) as dispatch_mock, patch(
+            "src.core.workflow.nodes.supervisor._select_assets_for_step", new=_select
+        ), patch("src.core.workflow.nodes.supervisor._generate_supervisor_report", new=_report):
+            cmd = await supervisor_node(state, {})
+        return cmd, [call.args[0] for call in dispatch_mock.await_args_list]
+
+    cmd, event_names = asyncio.run(_run())
+
+    assert cmd.goto == "writer"
+    assert cmd.update["messages"][0].content == "started"
+    assert cmd.update["selected_assets_by_step"] == {"1": ["asset-1"]}
+    assert event_names == ["data-plan_step_started", "plan_update", "data-step-assets-selected"]
+
+
+def test_supervisor_falls_back_when_asset_selection_raises() -> None:
+    state = {
+        "messages": [],
+        "plan": [
+            {
+                "id": 1,
+                "capability": "writer",
+                "status": "pending",
+                "title": "Story",
+                "instruction": "Write story",
+            }
+        ],
+        "artifacts": {},
+    }
+    asset_pool = {"asset-1": {"asset_id": "asset-1", "is_image": False}}
+
+    async def _select(**kwargs):
+        raise RuntimeError("selector down")
+
+    async def _run() -> tuple:
+        with patch("src.core.workflow.nodes.supervisor.adispatch_custom_event", new=AsyncMock()) as dispatch_mock, patch(
+            "src.core.workflow.nodes.supervisor._select_assets_for_step", new=_select
+        ), patch(
+            "src.core.workflow.nodes.supervisor.build_step_asset_pool", return_value=asset_pool
+        ), patch(
+            "src.core.workflow.nodes.supervisor._generate_supervisor_report", new=AsyncMock(return_value="started")
+        ):
+            cmd = await supervisor_node(state, {})
+        return cmd, [call.args[0] for call in dispatch_mock.await_args_list]
+
+    cmd, event_names = asyncio.run(_run())
+
+    assert cmd.goto == "writer"
+    assert cmd.update["messages"][0].content == "started"
+    assert cmd.update["selected_assets_by_step"] == {"1": ["asset-1"]}
+    assert cmd.update["asset_bindings_by_step"] == {"1": []}
+    assert event_names == ["data-plan_step_started", "plan_update", "data-step-assets-selected"]
+
+
 def test_supervisor_emits_plan_step_ended_event_for_completed_step() -> None:
     state = {
         "messages": [],
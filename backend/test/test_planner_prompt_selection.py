@@ -1,6 +1,6 @@
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from src.resources.prompts.template import apply_prompt_template
+from src.resources.prompts.template import _load_prompt_template, apply_prompt_template
 
 
 def _render_planner_prompt(product_type: str) -> str:
@@ -49,3 +49,14 @@ def test_planner_prompt_contains_single_turn_create_policy() -> None:
     prompt = _render_planner_prompt("slide")
     assert "Planning Policy (Important)" in prompt
     assert "`planning_mode` is always `create`." in prompt
+
+
+def test_planner_prompt_template_is_cached_per_product_type() -> None:
+    _load_prompt_template.cache_clear()
+    slide_prompt = _render_planner_prompt("slide")
+    _render_planner_prompt("slide")
+    comic_prompt = _render_planner_prompt("comic")
+
+    info = _load_prompt_template.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+    assert slide_prompt != comic_prompt
@@ -1,5 +1,6 @@
 from src.core.workflow.nodes.planner import (
     _build_attachment_signal,
+    _contains_research_requirement,
     _ensure_multi_perspective_research_steps,
     _missing_required_research_step,
 )
@@ -138,3 +139,9 @@ def test_build_attachment_signal_detects_pptx_from_context_only() -> None:
     assert signal["has_pptx_attachment"] is True
     assert signal["pptx_attachment_count"] == 0
     assert signal["pptx_context_template_count"] == 1
+
+
+def test_contains_research_requirement_matches_keywords_case_insensitively() -> None:
+    assert _contains_research_requirement("Please add a Source list")
+    assert _contains_research_requirement("史実に沿って描く")
+    assert not _contains_research_requirement("かわいい猫の漫画")
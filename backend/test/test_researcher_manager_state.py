@@ -1,9 +1,12 @@
 import asyncio
 import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from langgraph.types import Send
 
-from src.core.workflow.nodes.researcher import research_manager_node
+from src.core.workflow.nodes.researcher import build_researcher_subgraph, research_manager_node
+from src.shared.schemas import ResearchTask, ResearchTaskList
 
 
 def test_research_manager_dispatches_next_task_by_index_even_when_task_ids_duplicate() -> None:
@@ -115,3 +118,86 @@ def test_research_manager_emits_failure_artifact_when_state_is_inconsistent() ->
     assert artifact_payload["failed_checks"] == ["research_manager_state_inconsistent"]
     assert "inconsistent sequential state" in artifact_payload["summary"]
     assert "inconsistent sequential state" in cmd.update["plan"][0]["result_summary"]
+
+
+def _research_task(task_id: int) -> dict:
+    return {
+        "id": task_id,
+        "perspective": f"観点{task_id}",
+        "query_hints": [f"観点{task_id}"],
+        "priority": "medium",
+        "expected_output": f"観点{task_id}の要約",
+        "search_mode": "text_search",
+    }
+
+
+def test_research_manager_fans_out_next_batch_up_to_concurrency() -> None:
+    state = {
+        "plan": [
+            {
+                "id": 12,
+                "capability": "researcher",
+                "status": "in_progress",
+                "instruction": "調査する",
+            }
+        ],
+        "internal_research_tasks": [_research_task(i) for i in range(1, 6)],
+        "internal_research_results": [
+            {
+                "task_id": 1,
+                "perspective": "観点1",
+                "report": "ok",
+                "sources": [],
+                "image_candidates": [],
+                "confidence": 0.9,
+            }
+        ],
+        "is_decomposed": True,
+        "current_task_index": 1,
+        "messages": [],
+        "artifacts": {},
+    }
+
+    with patch("src.core.workflow.nodes.researcher.settings.RESEARCHER_CONCURRENCY", 3):
+        cmd = asyncio.run(research_manager_node(state, {}))
+
+    assert isinstance(cmd.goto, list)
+    assert [send.arg["task"]["id"] for send in cmd.goto] == [2, 3, 4]
+    assert all(send.node == "research_worker" for send in cmd.goto)
+    assert cmd.update == {"current_task_index": 4}
+
+
+def test_researcher_subgraph_runs_batches_in_parallel_and_finalizes() -> None:
+    tasks = ResearchTaskList(tasks=[ResearchTask(**_research_task(i)) for i in range(1, 4)])
+
+    class _FakeLLM:
+        async def astream(self, messages, config=None):
+            yield SimpleNamespace(content=f"{messages[-1].content[:20]} 完了")
+
+    state = {
+        "plan": [
+            {
+                "id": 13,
+                "capability": "researcher",
+                "status": "in_progress",
+                "instruction": "調査する",
+            }
+        ],
+        "messages": [],
+        "artifacts": {},
+    }
+
+    with patch("src.core.workflow.nodes.researcher.settings.RESEARCHER_CONCURRENCY", 2), patch(
+        "src.core.workflow.nodes.researcher.get_llm_by_type", return_value=_FakeLLM()
+    ), patch(
+        "src.core.workflow.nodes.researcher.run_structured_output", new=AsyncMock(return_value=tasks)
+    ), patch(
+        "src.core.workflow.nodes.researcher.adispatch_custom_event", new=AsyncMock()
+    ):
+        final_state = asyncio.run(build_researcher_subgraph().ainvoke(state))
+
+    assert {f"step_13_research_{i}" for i in range(1, 4)} <= set(final_state["artifacts"])
+    summary = json.loads(final_state["artifacts"]["step_13_research"])
+    assert summary["total_tasks"] == 3
+    assert summary["completed_tasks"] == 3
+    assert final_state["is_decomposed"] is False
@@ -1,8 +1,12 @@
 from src.core.workflow.nodes.researcher import (
+    MAX_RESEARCH_SOURCES,
     _build_fallback_research_tasks,
+    _dedupe_query_hints,
     _ensure_minimum_task_diversity,
     _ensure_unique_task_ids,
     _extract_instruction_perspectives,
+    _extract_urls,
+    _normalize_task_modes_by_instruction,
 )
 from src.shared.schemas import ResearchTask
 
@@ -79,3 +83,57 @@ def test_ensure_unique_task_ids_reindexes_duplicates() -> None:
 
     normalized = _ensure_unique_task_ids(tasks)
     assert [task.id for task in normalized] == [1, 2]
+    assert normalized[0] is tasks[0]
+
+
+def test_normalize_task_modes_keeps_text_search_tasks_as_is() -> None:
+    text_task = ResearchTask(
+        id=1,
+        perspective="観点A",
+        search_mode="text_search",
+        query_hints=["観点A"],
+        expected_output="A",
+    )
+    unset_task = ResearchTask(
+        id=2,
+        perspective="観点B",
+        search_mode=None,
+        query_hints=["観点B"],
+        expected_output="B",
+    )
+
+    normalized = _normalize_task_modes_by_instruction([text_task, unset_task], "調査する")
+    assert normalized[0] is text_task
+    assert normalized[1] is not unset_task
+    assert [task.search_mode for task in normalized] == ["text_search", "text_search"]
+
+
+def test_dedupe_query_hints_drops_hints_repeated_by_later_tasks() -> None:
+    first = ResearchTask(
+        id=1,
+        perspective="市場規模",
+        query_hints=["SaaS 市場規模", "SaaS 成長率"],
+        expected_output="A",
+    )
+    second = ResearchTask(
+        id=2,
+        perspective="成長要因",
+        query_hints=["saas 成長率 ", "SaaS 成長要因"],
+        expected_output="B",
+    )
+
+    deduped = _dedupe_query_hints([first, second])
+    assert deduped[0] is first
+    assert deduped[1].query_hints == ["SaaS 成長要因"]
+
+
+def test_extract_urls_stops_at_source_cap_and_keeps_order() -> None:
+    text = " ".join(
+        f"https://example.com/{i % (MAX_RESEARCH_SOURCES + 10)})."
+        for i in range(MAX_RESEARCH_SOURCES * 3)
+    )
+
+    urls = _extract_urls(text)
+    assert len(urls) == MAX_RESEARCH_SOURCES
+    assert urls[0] == "https://example.com/0"
+    assert urls[-1] == f"https://example.com/{MAX_RESEARCH_SOURCES - 1}"
@@ -0,0 +1,183 @@
+import asyncio
+import gc
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from src.core.workflow.nodes.researcher import research_worker_node
+
+
+class _FakeStreamingLLM:
+    def __init__(self, chunks: list[str]) -> None:
+        self._chunks = chunks
+
+    async def astream(self, messages, config=None):
+        for chunk in self._chunks:
+            yield SimpleNamespace(content=chunk)
+
+
+def _worker_state() -> dict:
+    return {
+        "task": {
+            "id": 3,
+            "perspective": "市場動向",
+            "query_hints": ["市場 最新"],
+            "priority": "high",
+            "expected_output": "市場動向の要約",
+            "search_mode": "text_search",
+        },
+        "step_id": 7,
+        "messages": [],
+        "artifacts": {},
+    }
+
+
+def test_research_worker_joins_streamed_chunks_into_report() -> None:
+    chunks = ["市場は", "拡大中。\n", "出典: https://example.com/a", "."]
+    llm = _FakeStreamingLLM(chunks)
+
+    with patch(
+        "src.core.workflow.nodes.researcher.get_llm_by_type", return_value=llm
+    ), patch(
+        "src.core.workflow.nodes.researcher.adispatch_custom_event", new=AsyncMock()
+    ) as dispatch_mock:
+        update = asyncio.run(research_worker_node(_worker_state(), {}))
+
+    result = update["internal_research_results"][0]
+    assert result.report == "".join(chunks)
+    assert result.sources == ["https://example.com/a"]
+
+    streamed = "".join(
+        call.args[1]["token"]
+        for call in dispatch_mock.await_args_list
+        if call.args[0] == "research_worker_token"
+    )
+    assert streamed == "".join(chunks)
+
+    artifact = json.loads(update["artifacts"]["step_7_research_3"])
+    assert artifact["report"] == "".join(chunks)
+    assert artifact["search_mode"] == "text_search"
+
+
+def test_research_worker_token_events_stay_ordered_when_dispatch_is_slow() -> None:
+    chunks = [f"行{i}\n" for i in range(6)]
+    llm = _FakeStreamingLLM(chunks)
+    events: list[tuple[str, dict]] = []
+
+    async def slow_dispatch(name, payload, config=None):
+        if name == "research_worker_token":
+            # Earlier tokens take longer, so unordered dispatch would reverse them.
+            await asyncio.sleep(0.001 * (10 - len(events)))
+        events.append((name, payload))
+
+    with patch(
+        "src.core.workflow.nodes.researcher.get_llm_by_type", return_value=llm
+    ), patch(
+        "src.core.workflow.nodes.researcher.adispatch_custom_event", new=slow_dispatch
+    ):
+        asyncio.run(research_worker_node(_worker_state(), {}))
+
+    names = [name for name, _ in events]
+    tokens = [payload["token"] for name, payload in events if name == "research_worker_token"]
+    assert "".join(tokens) == "".join(chunks)
+    assert names.index("data-research-report") > max(
+        i for i, name in enumerate(names) if name == "research_worker_token"
+    )
+
+
+def test_research_worker_reads_clock_once_per_few_chunks_between_flushes() -> None:
+    chunks = ["a"] * 12
+    llm = _FakeStreamingLLM(chunks)
+    clock_reads: list[int] = []
+
+    def frozen_monotonic() -> float:
+        clock_reads.append(1)
+        return 0.0
+
+    with patch(
+        "src.core.workflow.nodes.researcher.get_llm_by_type", return_value=llm
+    ), patch(
+        "src.core.workflow.nodes.researcher.adispatch_custom_event", new=AsyncMock()
+    ) as dispatch_mock, patch(
+        "src.core.workflow.nodes.researcher.time", new=SimpleNamespace(monotonic=frozen_monotonic)
+    ):
+        asyncio.run(research_worker_node(_worker_state(), {}))
+
+    tokens = [
+        call.args[1]["token"]
+        for call in dispatch_mock.await_args_list
+        if call.args[0] == "research_worker_token"
+    ]
+    assert tokens == ["a" * 12]
+    # Start of stream, one interval check per 4 buffered chunks, and the forced final flush.
+    assert len(clock_reads) == 1 + 3 + 1
+
+
+def test_research_worker_fails_when_a_non_final_token_dispatch_raises() -> None:
+    chunks = [f"行{i}\n" for i in range(6)]
+    llm = _FakeStreamingLLM(chunks)
+    events: list[tuple[str, dict]] = []
+    unhandled: list[dict] = []
+
+    async def failing_dispatch(name, payload, config=None):
+        if name == "research_worker_token" and payload["token"] == chunks[0]:
+            raise RuntimeError("dispatch down")
+        events.append((name, payload))
+
+    async def run() -> dict:
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        update = await research_worker_node(_worker_state(), {})
+        gc.collect()
+        await asyncio.sleep(0)
+        return update
+
+    with patch(
+        "src.core.workflow.nodes.researcher.get_llm_by_type", return_value=llm
+    ), patch(
+        "src.core.workflow.nodes.researcher.adispatch_custom_event", new=failing_dispatch
+    ):
+        update = asyncio.run(run())
+
+    result = update["internal_research_results"][0]
+    assert result.confidence == 0.0
+    assert "dispatch down" in result.report
+    assert "artifacts" not in update
+    report_events = [payload for name, payload in events if name == "data-research-report"]
+    assert [payload["status"] for payload in report_events] == ["failed"]
+    assert unhandled == []
+
+
+def test_research_worker_cancellation_stops_pending_token_dispatches() -> None:
+    stream_blocked = asyncio.Event()
+    dispatched: list[str] = []
+
+    class _HangingLLM:
+        async def astream(self, messages, config=None):
+            for i in range(3):
+                yield SimpleNamespace(content=f"行{i}\n")
+            stream_blocked.set()
+            await asyncio.Event().wait()
+
+    async def slow_dispatch(name, payload, config=None):
+        if name == "research_worker_token":
+            await asyncio.sleep(0.05)
+            dispatched.append(payload["token"])
+
+    async def run() -> None:
+        with patch(
+            "src.core.workflow.nodes.researcher.get_llm_by_type", return_value=_HangingLLM()
+        ), patch(
+            "src.core.workflow.nodes.researcher.adispatch_custom_event", new=slow_dispatch
+        ):
+            worker = asyncio.create_task(research_worker_node(_worker_state(), {}))
+            await stream_blocked.wait()
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+            await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+
+    assert dispatched == []
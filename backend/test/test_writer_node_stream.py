@@ -0,0 +1,68 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from src.core.workflow.nodes.writer import writer_node
+
+
+class _FakeStreamingLLM:
+    def __init__(self, chunks: list[str]) -> None:
+        self._chunks = chunks
+
+    async def astream(self, messages, config=None):
+        for chunk in self._chunks:
+            yield SimpleNamespace(content=chunk)
+
+
+def _writer_state() -> dict:
+    return {
+        "messages": [],
+        "product_type": "design",
+        "plan": [
+            {
+                "id": 2,
+                "capability": "writer",
+                "mode": "slide_outline",
+                "status": "in_progress",
+                "instruction": "構成を作る",
+            }
+        ],
+        "artifacts": {},
+    }
+
+
+def _outline_json() -> str:
+    return json.dumps(
+        {
+            "execution_summary": "構成を作成しました",
+            "user_message": "2枚の構成です",
+            "slides": [
+                {"slide_number": 1, "title": "表紙", "bullet_points": ["概要"]},
+                {"slide_number": 2, "title": "市場", "bullet_points": ["規模 3兆円"]},
+            ],
+        },
+        ensure_ascii=False,
+    )
+
+
+def test_writer_recovers_json_followed_by_trailing_prose_without_repair() -> None:
+    body = _outline_json()
+    chunks = [body[:40], body[40:], "\n以上です。{補足}"]
+
+    with patch(
+        "src.core.workflow.nodes.writer.get_llm_by_type", return_value=_FakeStreamingLLM(chunks)
+    ), patch(
+        "src.core.workflow.nodes.writer.adispatch_custom_event", new=AsyncMock()
+    ) as dispatch_mock, patch(
+        "src.core.workflow.nodes.writer.run_structured_output", new=AsyncMock()
+    ) as repair_mock:
+        command = asyncio.run(writer_node(_writer_state(), {}))
+
+    repair_mock.assert_not_awaited()
+    artifact = json.loads(command.update["artifacts"]["step_2_story"])
+    assert [slide["title"] for slide in artifact["slides"]] == ["表紙", "市場"]
+
+    event_name, event_payload = dispatch_mock.await_args.args
+    assert event_name == "writer-output"
+    assert event_payload["output"] == artifact
@@ -20,7 +20,7 @@ async def main():
     print("=== Researcher Grounding Verification ===")
     
     # adispatch_custom_event をパッチして、スタンドアロン実行時のエラーを回避
-    with patch("langchain_core.callbacks.manager.adispatch_custom_event"):
+    with patch("src.core.workflow.nodes.researcher.adispatch_custom_event"):
         # 最近の出来事に関するタスクを作成
         task = ResearchTask(
             id=1,